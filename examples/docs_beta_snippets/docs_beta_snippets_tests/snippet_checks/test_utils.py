@@ -0,0 +1,54 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from docs_beta_snippets_tests.snippet_checks.utils import _needs_shell, _run_command
+
+
+@pytest.mark.parametrize(
+    "cmd, needs_shell",
+    [
+        ("echo hello", False),
+        ("ls -la", False),
+        ("cd foo", True),
+        ("export A=1", True),
+        ("umask 022", True),
+        ("source .venv/bin/activate", True),
+        (". .venv/bin/activate", True),
+        ("A=1 env", True),
+        ("echo hello | cat", True),
+        ("echo $HOME", True),
+        ("not-a-real-executable-for-snippet-checks", True),
+    ],
+)
+def test_needs_shell(cmd: str, needs_shell: bool) -> None:
+    assert _needs_shell(cmd) is needs_shell
+
+
+def test_run_command_builtin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    assert _run_command("export A=1") == ""
+    assert _run_command("umask 022") == ""
+    assert _run_command("exit 3", expect_error=True) == ""
+
+
+def test_run_command_plain(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    assert _run_command("echo hello") == "hello"
+    assert _run_command(["echo", "hello world"]) == "hello world"
+
+
+def test_run_command_shell_syntax(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    assert _run_command("echo hello | tr a-z A-Z").strip() == "HELLO"
+    (tmp_path / "subdir").mkdir()
+    _run_command("cd subdir")
+    assert Path.cwd() == tmp_path / "subdir"
+
+
+def test_run_command_missing_executable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        _run_command("not-a-real-executable-for-snippet-checks")
+    assert exc_info.value.returncode == 127
@@ -1,6 +1,9 @@
+import functools
 import logging
 import os
 import re
+import shlex
+import shutil
 import subprocess
 from collections.abc import Sequence
 from pathlib import Path
@@ -24,7 +27,7 @@
         [@-~]   # Final byte
     )
 """,
-    re.VERBOSE,
+    re.VERBOSE | re.ASCII,
 )
 
 
@@ -35,31 +38,100 @@ def snippet_to_regex_fn(snippet: str) -> str:
     return re.escape(snippet).replace(r"\.\.\.", ".*")
 
 
+@functools.lru_cache(maxsize=512)
+def _compiled(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def _escape(match_str: str) -> str:
+    return re.escape(match_str)
+
+
 def re_ignore_before(match_str: str) -> tuple[str, str]:
     """Generates a regex substitution pair that replaces any text before `match_str` with
     an ellipses.
     """
-    return (rf"[\s\S]*{re.escape(match_str)}", f"...\n{match_str}")
+    return (rf"[\s\S]*{_escape(match_str)}", f"...\n{match_str}")
 
 
 def re_ignore_after(match_str: str) -> tuple[str, str]:
     """Generates a regex substitution pair that replaces any text after `match_str` with
     an ellipses.
     """
-    return (rf"{re.escape(match_str)}[\s\S]*", f"{match_str}\n...")
+    return (rf"{_escape(match_str)}[\s\S]*", f"{match_str}\n...")
 
 
-PWD_REGEX = re.compile(r"PWD=(.*?);")
+# Matches either the trailing `PWD=...;` marker emitted by `_run_command` or an ANSI escape
+# sequence, so that both can be stripped from command output in a single pass.
+_CLEANUP_RE = re.compile(
+    rf"(?P<pwd>PWD=(?P<pwd_path>.*?);)|(?P<ansi>{ANSI_ESCAPE.pattern})",
+    re.VERBOSE | re.ASCII,
+)
+
+
+_SHELL_METACHARACTERS = frozenset("|&;<>()$`\\\"'*?[]{}~#!\n")
+
+
+# Builtins that only exist inside the shell, or whose effects (e.g. on the environment or working
+# directory) only make sense there
+_SHELL_BUILTINS = frozenset(
+    [
+        "cd",
+        "export",
+        "source",
+        ".",
+        "set",
+        "unset",
+        "umask",
+        "exit",
+        "alias",
+        "pushd",
+        "popd",
+        "eval",
+        "exec",
+    ]
+)
+
+
+def _needs_shell(cmd: str) -> bool:
+    """Whether `cmd` relies on the shell, either through shell syntax, an environment assignment,
+    or a shell builtin rather than an executable on the PATH.
+    """
+    if not _SHELL_METACHARACTERS.isdisjoint(cmd):
+        return True
+    words = cmd.split(maxsplit=1)
+    return (
+        not words
+        or "=" in words[0]
+        or words[0] in _SHELL_BUILTINS
+        or shutil.which(words[0]) is None
+    )
+
+
+def _check_output_without_shell(argv: Sequence[str]) -> bytes:
+    try:
+        return subprocess.check_output(argv, stderr=subprocess.STDOUT)
+    except OSError as e:
+        # Without a shell, failing to exec the command (e.g. a missing executable) raises rather
+        # than exiting with 127/126, so report it as a failed command to match the shell path
+        returncode = 127 if isinstance(e, FileNotFoundError) else 126
+        raise subprocess.CalledProcessError(returncode, argv, output=str(e).encode("utf-8")) from e
 
 
 def _run_command(cmd: Union[str, Sequence[str]], expect_error: bool = False) -> str:
-    if not isinstance(cmd, str):
-        cmd = " ".join(cmd)
+    if isinstance(cmd, str):
+        argv = None if _needs_shell(cmd) else shlex.split(cmd)
+    else:
+        # argv-style commands are run as-is, rather than being joined back together and
+        # re-tokenized by the shell
+        argv = list(cmd)
+        cmd = shlex.join(argv)
 
     try:
         if cmd.startswith("duckdb"):
             actual_output = _run_duckdb_command(cmd)
-        else:
+        elif argv is None:
             actual_output = (
                 subprocess.check_output(
                     f'{cmd} && echo "PWD=$(pwd);"', shell=True, stderr=subprocess.STDOUT
@@ -67,6 +139,10 @@ def _run_command(cmd: Union[str, Sequence[str]], expect_error: bool = False) ->
                 .decode("utf-8")
                 .strip()
             )
+        else:
+            # Plain commands can't change the working directory, so skip spawning a shell
+            # and the PWD round-trip
+            actual_output = _check_output_without_shell(argv).decode("utf-8").strip()
         if expect_error:
             print(f"Ran command {cmd}")  # noqa: T201
             print("Got output:")  # noqa: T201
@@ -81,12 +157,19 @@ def _run_command(cmd: Union[str, Sequence[str]], expect_error: bool = False) ->
             print(e.output.decode("utf-8").strip())  # noqa: T201
             raise
 
-    pwd = PWD_REGEX.search(actual_output)
-    if pwd:
-        actual_output = PWD_REGEX.sub("", actual_output)
-        os.chdir(pwd.group(1))
+    pwd: Optional[str] = None
 
-    actual_output = ANSI_ESCAPE.sub("", actual_output)
+    def _cleanup_cb(match: re.Match) -> str:
+        nonlocal pwd
+        if match.group("pwd") is not None and pwd is None:
+            pwd = match.group("pwd_path")
+        return ""
+
+    # Most plain commands produce neither, in which case we can skip the regex pass entirely
+    if "\x1b" in actual_output or "PWD=" in actual_output:
+        actual_output = _CLEANUP_RE.sub(_cleanup_cb, actual_output)
+    if pwd:
+        os.chdir(pwd)
 
     return actual_output
 
@@ -112,7 +195,8 @@ def _run_duckdb_command(cmd: str) -> str:
     child.expect(pexpect.EOF)
     output = child.before
     assert output is not None
-    output = ANSI_ESCAPE.sub("", output)
+    if "\x1b" in output:
+        output = ANSI_ESCAPE.sub("", output)
     # \r\r can sometimes happen due to weird interactions between pexpect and DuckDB
     output = output.replace("\r\r", "\r")
     return _extract_output_table_from_duckdb_output(output)
@@ -147,21 +231,24 @@ def _assert_matches_or_update_snippet(
     )
     if snippet_replace_regex:
         for regex, replacement in snippet_replace_regex:
-            contents = re.sub(regex, replacement, contents, re.MULTILINE | re.DOTALL)
+            # compiled with default flags (the old call passed the flags as `count`); every
+            # occurrence is replaced
+            contents = _compiled(regex).sub(replacement, contents)
+    contents = contents.rstrip()
 
     snippet_output_file = Path(snippet_path)
     snippet_output_file.parent.mkdir(parents=True, exist_ok=True)
 
     if update_snippets:
-        snippet_output_file.write_text(f"{contents.rstrip()}\n")
+        snippet_output_file.write_text(f"{contents}\n", encoding="utf-8")
         print(f"Updated snippet at {snippet_path}")  # noqa: T201
     else:
-        if not snippet_output_file.exists():
-            raise Exception(f"Snippet at {snippet_path} does not exist")
-
-        contents = contents.rstrip()
-        snippet_contents = snippet_output_file.read_text().rstrip()
-        if not comparison_fn(contents, snippet_contents):
+        try:
+            snippet_contents = snippet_output_file.read_text(encoding="utf-8").rstrip()
+        except FileNotFoundError:
+            raise Exception(f"Snippet at {snippet_path} does not exist") from None
+        matches = comparison_fn(contents, snippet_contents)
+        if not matches:
             print(f"Snapshot mismatch {snippet_path}")  # noqa: T201
             print("\nActual file:")  # noqa: T201
             print(contents)  # noqa: T201
@@ -170,8 +257,8 @@ def _assert_matches_or_update_snippet(
         else:
             print(f"Snippet {snippet_path} passed")  # noqa: T201
 
-        assert comparison_fn(
-            contents, snippet_contents
+        assert (
+            matches
         ), "CLI snippets do not match.\nYou may need to run `make regenerate_cli_snippets` in the `dagster/docs` directory.\nYou may also use `make test_cli_snippets_simulate_bk` to simulate the CI environment locally."
 
 
@@ -193,7 +280,7 @@ def create_file(
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    file_path.write_text(contents)
+    file_path.write_text(contents, encoding="utf-8")
     if snippet_path:
         _assert_matches_or_update_snippet(
             contents=contents,
@@ -204,47 +291,33 @@ def create_file(
         )
 
 
+# Characters which prefix filepath lines in the output of `tree`
+_TREE_PIPE_CHARS = ("│", "├", "└")
+
+
+def _partition_tree_output(text: str) -> tuple[list[str], list[str]]:
+    """Splits the output of `tree` into its non-filepath lines and the sorted filenames
+    from its filepath lines, in a single pass.
+    """
+    non_filepath_lines = []
+    filenames = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if stripped.startswith(_TREE_PIPE_CHARS):
+            # strip out non-filename text from each of the filepath lines
+            filenames.append(stripped.rsplit(" ", 1)[1])
+        else:
+            non_filepath_lines.append(line)
+    return non_filepath_lines, sorted(filenames)
+
+
 def compare_tree_output(actual: str, expected: str) -> bool:
     """Custom command output comparison function for the output of calling
     `tree`. Often the order of the output is different on different platforms, so we
     just check that the filenames are identical rather than the precise tree order or
     structure.
     """
-    TREE_PIPE_CHARS = ["│", "├", "└"]
-    actual_non_filepath_lines = [
-        line
-        for line in actual.split("\n")
-        if not any(line.strip().startswith(c) for c in TREE_PIPE_CHARS)
-    ]
-    expected_non_filepath_lines = [
-        line
-        for line in expected.split("\n")
-        if not any(line.strip().startswith(c) for c in TREE_PIPE_CHARS)
-    ]
-
-    actual_filepath_lines = [
-        line
-        for line in actual.split("\n")
-        if any(line.strip().startswith(c) for c in TREE_PIPE_CHARS)
-    ]
-    expected_filepath_lines = [
-        line
-        for line in expected.split("\n")
-        if any(line.strip().startswith(c) for c in TREE_PIPE_CHARS)
-    ]
-
-    # strip out non-filename text from each of the filepath lines
-    actual_filepath_lines = sorted(
-        [line.strip().rsplit(" ", 1)[1] for line in actual_filepath_lines]
-    )
-    expected_filepath_lines = sorted(
-        [line.strip().rsplit(" ", 1)[1] for line in expected_filepath_lines]
-    )
-
-    return (
-        actual_non_filepath_lines == expected_non_filepath_lines
-        and actual_filepath_lines == expected_filepath_lines
-    )
+    return _partition_tree_output(actual) == _partition_tree_output(expected)
 
 
 def check_file(
@@ -269,8 +342,10 @@ def check_file(
             Useful to remove dynamic content, e.g. the temporary directory path or timestamps.
     """
     file_path = Path(file_path)
-    assert file_path.exists(), f"Expected file {file_path} to exist"
-    contents = file_path.read_text()
+    try:
+        contents = file_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise AssertionError(f"Expected file {file_path} to exist") from None
 
     if snippet_path:
         assert update_snippets is not None
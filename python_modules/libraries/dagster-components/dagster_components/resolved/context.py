@@ -1,8 +1,11 @@
+import functools
 import os
 import sys
 import traceback
-from collections.abc import Mapping, Sequence
-from typing import Any, Optional, TypeVar, Union, overload
+from collections import ChainMap
+from collections.abc import Iterator, Mapping, Sequence
+from types import MappingProxyType
+from typing import Any, Callable, NamedTuple, Optional, TypeVar, Union, overload
 
 from dagster._core.definitions.declarative_automation.automation_condition import (
     AutomationCondition,
@@ -11,7 +14,7 @@
 from dagster._utils.source_position import SourcePositionTree
 from jinja2 import Undefined
 from jinja2.exceptions import UndefinedError
-from jinja2.nativetypes import NativeTemplate
+from jinja2.nativetypes import NativeEnvironment, NativeTemplate, native_concat
 
 T = TypeVar("T")
 
@@ -20,15 +23,46 @@ def env_scope(key: str) -> Optional[str]:
     return os.environ.get(key)
 
 
-def automation_condition_scope() -> Mapping[str, Any]:
-    return {
+_AUTOMATION_CONDITION_SCOPE: Mapping[str, Any] = MappingProxyType(
+    {
         "eager": AutomationCondition.eager,
         "on_cron": AutomationCondition.on_cron,
     }
+)
+
+
+def automation_condition_scope() -> Mapping[str, Any]:
+    return _AUTOMATION_CONDITION_SCOPE
+
+
+_DEFAULT_SCOPE: Mapping[str, Any] = MappingProxyType(
+    {"env": env_scope, "automation_condition": _AUTOMATION_CONDITION_SCOPE}
+)
 
 
 T = TypeVar("T")
 
+_TEMPLATE_ENV = NativeEnvironment()
+
+
+@functools.lru_cache(maxsize=1024)
+def _template_from_string(source: str) -> NativeTemplate:
+    return _TEMPLATE_ENV.from_string(source)
+
+
+def _is_plain_string(val: str) -> bool:
+    """Whether `val` contains no template syntax, such that rendering it would only strip a
+    single trailing newline and coerce the result to a native type. Strings containing carriage
+    returns, or which would render to nothing, are left to Jinja.
+    """
+    return (
+        "{{" not in val
+        and "{%" not in val
+        and "{#" not in val
+        and "\r" not in val
+        and val not in ("", "\n")
+    )
+
 
 class ResolutionException(Exception): ...
 
@@ -45,12 +79,12 @@ def at_path(self, path_part: Union[str, int]):
     @staticmethod
     def default(source_position_tree: Optional[SourcePositionTree] = None) -> "ResolutionContext":
         return ResolutionContext(
-            scope={"env": env_scope, "automation_condition": automation_condition_scope()},
+            scope=_DEFAULT_SCOPE,
             source_position_tree=source_position_tree,
         )
 
     def with_scope(self, **additional_scope) -> "ResolutionContext":
-        return copy(self, scope={**self.scope, **additional_scope})
+        return copy(self, scope=ChainMap(additional_scope, self.scope))
 
     def _location(self) -> Optional[str]:
         if self.source_position_tree:
@@ -93,9 +127,11 @@ def _scope_threw_exc(self, fmt_exc: list[str]):
 
     def _resolve_inner_value(self, val: Any) -> Any:
         """Resolves a single value, if it is a templated string."""
-        if isinstance(val, str):
+        if isinstance(val, str) and _is_plain_string(val):
+            return native_concat([val[:-1] if val.endswith("\n") else val])
+        elif isinstance(val, str):
             try:
-                val = NativeTemplate(val).render(**self.scope)
+                val = _template_from_string(val).render(self.scope)
                 if isinstance(val, Undefined):
                     raise self._invalid_scope_exc(val._undefined_message) from None  # noqa: SLF001
                 return val
@@ -127,11 +163,78 @@ def resolve_value(self, val: Sequence) -> Sequence: ...
 
     def resolve_value(self, val: Any, as_type: Optional[type] = None) -> Any:
         """Recursively resolves templated values in a nested object."""
-        if isinstance(val, dict):
-            return {k: self.at_path(k).resolve_value(v) for k, v in val.items()}
-        elif isinstance(val, tuple):
-            return tuple(self.at_path(i).resolve_value(v) for i, v in enumerate(val))
-        elif isinstance(val, list):
-            return [self.at_path(i).resolve_value(v) for i, v in enumerate(val)]
+        handler = _container_handler(val)
+        if handler is not None:
+            # descend using a single context whose path is pushed to and popped from in place,
+            # rather than allocating a new context and path for every element
+            return copy(self, path=list(self.path))._resolve_nested_value(val, handler)
         else:
             return self._resolve_inner_value(val)
+
+    def _resolve_nested_value(self, val: Any, handler: "_ContainerHandler") -> Any:
+        # Walks the nested value using an explicit stack rather than recursion. Each frame holds a
+        # container, its handler, an iterator over its (key, value) pairs and its resolved values
+        # so far. The key of the value currently being resolved is kept at the end of the path, so
+        # that errors are reported at the right location.
+        stack = [(val, handler, handler.items(val), [])]
+        while True:
+            container, handler, items, resolved = stack[-1]
+            for key, item in items:
+                self.path.append(key)
+                item_handler = _container_handler(item)
+                if item_handler is not None:
+                    # resolve the inner container before continuing with this one
+                    stack.append((item, item_handler, item_handler.items(item), []))
+                    break
+                resolved.append(self._resolve_inner_value(item))
+                self.path.pop()
+            else:
+                stack.pop()
+                value = handler.rebuild(container, resolved)
+                if not stack:
+                    return value
+                stack[-1][3].append(value)
+                self.path.pop()
+
+
+class _ContainerHandler(NamedTuple):
+    items: Callable[[Any], Iterator[tuple[Any, Any]]]
+    rebuild: Callable[[Any, list[Any]], Any]
+
+
+_DICT_HANDLER = _ContainerHandler(
+    items=lambda val: iter(val.items()),
+    rebuild=lambda val, resolved: dict(zip(val.keys(), resolved)),
+)
+_TUPLE_HANDLER = _ContainerHandler(items=enumerate, rebuild=lambda _, resolved: tuple(resolved))
+_LIST_HANDLER = _ContainerHandler(items=enumerate, rebuild=lambda _, resolved: resolved)
+
+# Handlers keyed by exact type, so that the common case is dispatched with a single lookup. The
+# common leaf types map to None, marking them as scalars. Any other type, including subclasses of
+# dict, tuple and list, falls back to an isinstance check in `_container_handler` rather than being
+# added here, so the table never grows.
+_CONTAINER_HANDLERS: dict[type, Optional[_ContainerHandler]] = {
+    dict: _DICT_HANDLER,
+    tuple: _TUPLE_HANDLER,
+    list: _LIST_HANDLER,
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+    type(None): None,
+}
+_UNKNOWN_TYPE: Any = object()
+
+
+def _container_handler(val: Any) -> Optional[_ContainerHandler]:
+    handler = _CONTAINER_HANDLERS.get(type(val), _UNKNOWN_TYPE)
+    if handler is not _UNKNOWN_TYPE:
+        return handler
+    elif not isinstance(val, (dict, tuple, list)):
+        return None
+    elif isinstance(val, dict):
+        return _DICT_HANDLER
+    elif isinstance(val, tuple):
+        return _TUPLE_HANDLER
+    else:
+        return _LIST_HANDLER
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from typing import NamedTuple
+
+import pytest
+from dagster._utils.yaml_utils import parse_yaml_with_source_positions
+from dagster_components.resolved.context import ResolutionContext, ResolutionException
+from jinja2.nativetypes import NativeTemplate
+
+
+class _Pair(NamedTuple):
+    first: str
+    second: str
+
+
+class _ListSubclass(list):
+    pass
+
+
+def test_resolve_scalars() -> None:
+    val = [1, 1.5, True, None, b"bytes"]
+    resolved = ResolutionContext.default().resolve_value(val)
+    assert resolved == val
+    assert [type(v) for v in resolved] == [int, float, bool, type(None), bytes]
+
+
+def test_resolve_dict_subclass() -> None:
+    val = OrderedDict([("a", "{{ foo }}"), ("b", 1)])
+    resolved = ResolutionContext.default().with_scope(foo="bar").resolve_value(val)
+    assert type(resolved) is dict
+    assert resolved == {"a": "bar", "b": 1}
+
+
+def test_resolve_named_tuple() -> None:
+    val = _Pair(first="{{ foo }}", second="baz")
+    resolved = ResolutionContext.default().with_scope(foo="bar").resolve_value(val)
+    assert type(resolved) is tuple
+    assert resolved == ("bar", "baz")
+
+
+def test_resolve_list_subclass() -> None:
+    val = _ListSubclass(["{{ foo }}", ["{{ foo }}"]])
+    resolved = ResolutionContext.default().with_scope(foo="bar").resolve_value(val)
+    assert type(resolved) is list
+    assert resolved == ["bar", ["bar"]]
+
+
+def test_resolve_deeply_nested_value() -> None:
+    depth = 5000
+    val = ["{{ foo }}"]
+    for _ in range(depth):
+        val = [val]
+
+    resolved = ResolutionContext.default().with_scope(foo="bar").resolve_value(val)
+    for _ in range(depth):
+        assert type(resolved) is list
+        assert len(resolved) == 1
+        resolved = resolved[0]
+    assert resolved == ["bar"]
+
+
+def test_nested_undefined_error_location() -> None:
+    source = """
+a:
+  - 1
+  - b: "{{ undefined }}"
+"""
+    parsed = parse_yaml_with_source_positions(source, filename="component.yaml")
+    context = ResolutionContext.default(source_position_tree=parsed.source_position_tree)
+
+    with pytest.raises(ResolutionException) as exc_info:
+        context.resolve_value(parsed.value)
+
+    message = str(exc_info.value)
+    assert message.startswith("component.yaml:4\n")
+    assert "UndefinedError: 'undefined' not found in scope" in message
+    # the caller's path is not modified while descending into the value
+    assert context.path == []
+
+
+@pytest.mark.parametrize(
+    "val", ["123", "a", "a\n", "a\n\n", "", "\n", "x\r\n", "[1, 2]", "None", "{{ foo }}"]
+)
+def test_plain_string_matches_native_template(val: str) -> None:
+    context = ResolutionContext.default().with_scope(foo="bar")
+    expected = NativeTemplate(val).render(**context.scope)
+    resolved = context.resolve_value(val)
+    assert type(resolved) is type(expected)
+    assert resolved == expected
@@ -2,10 +2,9 @@
 import sys
 from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Any, NamedTuple, Optional
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
 
 import click
-from jsonschema import Draft202012Validator, ValidationError
 from yaml.scanner import ScannerError
 
 from dagster_dg.cli.check_utils import error_dict_to_formatted_error
@@ -26,6 +25,9 @@
     ValueAndSourcePositionTree,
 )
 
+if TYPE_CHECKING:
+    from jsonschema import ValidationError
+
 
 @click.group(name="check", cls=DgClickGroup)
 def check_group():
@@ -62,7 +64,7 @@ def _scaffold_value_and_source_position_tree(
 
 class ErrorInput(NamedTuple):
     component_name: Optional[ComponentKey]
-    error: ValidationError
+    error: "ValidationError"
     source_position_tree: ValueAndSourcePositionTree
 
 
@@ -78,6 +80,9 @@ def check_yaml_command(
     **global_options: object,
 ) -> None:
     """Check component.yaml files against their schemas, showing validation errors."""
+    # jsonschema is slow to import and only needed here, so defer it until the command runs
+    from jsonschema import Draft202012Validator, ValidationError
+
     resolved_paths = [Path(path).absolute() for path in paths]
     top_level_component_validator = Draft202012Validator(schema=COMPONENT_FILE_SCHEMA)
 
@@ -1,14 +1,16 @@
 import re
 from collections.abc import Sequence
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import click
 import typer
-from jsonschema import ValidationError
 
 from dagster_dg.component_key import ComponentKey
 from dagster_dg.yaml_utils.source_position import SourcePositionTree
 
+if TYPE_CHECKING:
+    from jsonschema import ValidationError
+
 
 @click.group(name="check")
 def check_cli():
@@ -45,7 +47,7 @@ def augment_inline_error_message(location: str, msg: str):
 )
 
 
-def augment_error_path(error_details: ValidationError) -> Sequence[Union[str, int]]:
+def augment_error_path(error_details: "ValidationError") -> Sequence[Union[str, int]]:
     """Augment the error location (e.g. key) for certain error messages.
 
     In particular, for extra properties, returns the location of the extra property instead
@@ -68,7 +70,7 @@ def format_indented_error_msg(col: int, msg: str) -> str:
 
 def error_dict_to_formatted_error(
     component_key: Optional[ComponentKey],
-    error_details: ValidationError,
+    error_details: "ValidationError",
     source_position_tree: SourcePositionTree,
     prefix: Sequence[str] = (),
 ) -> str:
@@ -80,17 +80,23 @@ def list_component_type_command(output_json: bool, **global_options: object) ->
     dg_context = DgContext.for_defined_registry_environment(Path.cwd(), cli_config)
     registry = RemoteComponentRegistry.from_dg_context(dg_context)
 
-    sorted_keys = sorted(registry.keys() - SHIM_COMPONENTS.keys(), key=lambda k: k.to_typename())
+    sorted_component_types = sorted(
+        (
+            (key.to_typename(), component_type)
+            for key, component_type in registry.items()
+            if key not in SHIM_COMPONENTS
+        ),
+        key=lambda item: item[0],
+    )
 
     # JSON
     if output_json:
         output: list[dict[str, object]] = []
-        for key in sorted_keys:
-            component_type_metadata = registry.get(key)
+        for typename, component_type in sorted_component_types:
             output.append(
                 {
-                    "key": key.to_typename(),
-                    "summary": component_type_metadata.summary,
+                    "key": typename,
+                    "summary": component_type.summary,
                 }
             )
         click.echo(json.dumps(output, indent=4))
@@ -100,8 +106,8 @@ def list_component_type_command(output_json: bool, **global_options: object) ->
         table = Table(border_style="dim")
         table.add_column("Component Type", style="bold cyan", no_wrap=True)
         table.add_column("Summary")
-        for key in sorted_keys:
-            table.add_row(key.to_typename(), registry.get(key).summary)
+        for typename, component_type in sorted_component_types:
+            table.add_row(typename, component_type.summary)
         console = Console()
         console.print(table)
 
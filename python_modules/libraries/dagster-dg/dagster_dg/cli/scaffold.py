@@ -174,12 +174,17 @@ def scaffold_project_command(
 #
 # To handle this, we define a custom click.Group subclass that loads the commands on demand.
 class ComponentScaffoldGroup(DgClickGroup):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._commands_defined = False
+    # Records in the click context's shared `meta` that the commands have been defined for the
+    # current invocation, so that e.g. `--help` (which calls `get_command` for every listed command)
+    # only loads the registry once. This is tracked per invocation rather than on the group since
+    # the group is reused across invocations (e.g. by `CliRunner` in tests).
+    _COMMANDS_DEFINED_META_KEY = "dagster_dg.scaffold_component.commands_defined"
+
+    def _commands_defined(self, cli_context: click.Context) -> bool:
+        return cli_context.meta.get(self._COMMANDS_DEFINED_META_KEY, False)
 
     def get_command(self, cli_context: click.Context, cmd_name: str) -> Optional[click.Command]:
-        if not self._commands_defined:
+        if not self._commands_defined(cli_context):
             self._define_commands(cli_context)
         cmd = super().get_command(cli_context, cmd_name)
         if cmd is None:
@@ -187,7 +192,7 @@ def get_command(self, cli_context: click.Context, cmd_name: str) -> Optional[cli
         return cmd
 
     def list_commands(self, cli_context: click.Context) -> list[str]:
-        if not self._commands_defined:
+        if not self._commands_defined(cli_context):
             self._define_commands(cli_context)
         return super().list_commands(cli_context)
 
@@ -202,6 +207,7 @@ def _define_commands(self, cli_context: click.Context) -> None:
         for key, component_type in registry.items():
             command = _create_component_scaffold_subcommand(key, component_type)
             self.add_command(command)
+        cli_context.meta[self._COMMANDS_DEFINED_META_KEY] = True
 
 
 class ComponentScaffoldSubCommand(DgClickCommand):
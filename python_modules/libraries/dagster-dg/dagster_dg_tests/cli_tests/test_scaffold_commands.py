@@ -371,6 +371,43 @@ def test_scaffold_component_dynamic_subcommand_generation() -> None:
             assert standardize_box_characters(line) in normalized_output
 
 
+def test_scaffold_component_subcommands_loads_registry_once_per_invocation(monkeypatch) -> None:
+    component_commands: list[list[str]] = []
+
+    def _fake_external_components_command(self, command: list[str], log: bool = True) -> str:
+        component_commands.append(command)
+        return json.dumps(
+            {
+                f"foo_bar.lib.Component{i}": {
+                    "name": f"Component{i}",
+                    "namespace": "foo_bar.lib",
+                    "summary": None,
+                    "description": None,
+                    "scaffold_params_schema": None,
+                    "component_schema": None,
+                }
+                for i in range(3)
+            }
+        )
+
+    monkeypatch.setattr(DgContext, "external_components_command", _fake_external_components_command)
+    monkeypatch.setattr(
+        "dagster_dg.context._validate_dagster_components_availability", lambda context: None
+    )
+    with ProxyRunner.test(disable_cache=True) as runner, runner.isolated_filesystem():
+        # `--help` looks up every subcommand after listing them, which should all be served from
+        # the commands defined on the first lookup
+        result = runner.invoke("scaffold", "component", "--help")
+        assert_runner_result(result)
+        assert "foo_bar.lib.Component2" in result.output
+        assert component_commands == [["list", "component-types"]]
+
+        # A new invocation reloads the registry, since the available component types may change
+        result = runner.invoke("scaffold", "component", "--help")
+        assert_runner_result(result)
+        assert len(component_commands) == 2
+
+
 @pytest.mark.parametrize("in_workspace", [True, False])
 def test_scaffold_component_no_params_success(in_workspace: bool) -> None:
     with (